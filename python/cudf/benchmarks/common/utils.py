@@ -2,9 +2,9 @@
 
 """Common utilities for fixture creation and benchmarking."""
 
+import functools
 import inspect
 import re
-import textwrap
 from collections.abc import MutableSet
 from itertools import groupby
 from numbers import Real
@@ -142,40 +142,24 @@ def benchmark_with_object(
         # identical to that of the decorated benchmark except with the user's
         # fixture name replaced by the true fixture name based on the arguments
         # to benchmark_with_object.
-        parameters = inspect.signature(bm).parameters
-
-        # Note: This logic assumes that any benchmark using this fixture has at
-        # least two parameters since they must be using both the
-        # pytest-benchmark `benchmark` fixture and the cudf object.
-        params_str = ", ".join(f"{p}" for p in parameters if p != cls)
-        arg_str = ", ".join(f"{p}={p}" for p in parameters if p != cls)
-
-        if params_str:
-            params_str += ", "
-        if arg_str:
-            arg_str += ", "
-
-        params_str += f"{fixture_name}"
-        arg_str += f"{cls}={fixture_name}"
-
-        src = textwrap.dedent(
-            f"""
-            import makefun
-            @makefun.wraps(
-                bm,
-                remove_args=("{cls}",),
-                prepend_args=("{fixture_name}",)
-            )
-            def wrapped_bm({params_str}):
-                return bm({arg_str})
-            """
+        # Note that functools.wraps also copies over any marks applied to the
+        # original benchmark, since they are stored in its __dict__.
+        @functools.wraps(bm)
+        def wrapped_bm(**kwargs):
+            # pytest always passes fixtures by name.
+            kwargs[cls] = kwargs.pop(fixture_name)
+            return bm(**kwargs)
+
+        signature = inspect.signature(bm)
+        wrapped_bm.__signature__ = signature.replace(
+            parameters=[
+                inspect.Parameter(
+                    fixture_name, inspect.Parameter.POSITIONAL_OR_KEYWORD
+                ),
+                *(p for p in signature.parameters.values() if p.name != cls),
+            ]
         )
-        globals_ = {"bm": bm}
-        exec(src, globals_)
-        wrapped_bm = globals_["wrapped_bm"]
-        # In case marks were applied to the original benchmark, copy them over.
-        if marks := getattr(bm, "pytestmark", None):
-            wrapped_bm.pytestmark = marks
+
         wrapped_bm.place_as = bm
         return wrapped_bm
 
@@ -55,3 +55,6 @@ comparison_ops = [
     operator.gt,
     operator.ge,
 ]
+
+# All ops typed and lowered for a pair of operands
+binary_ops = (*arith_ops, *bitwise_ops, *comparison_ops)
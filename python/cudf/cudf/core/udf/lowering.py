@@ -12,12 +12,7 @@ from numba.cuda.cudaimpl import (
 from numba.extending import lower_builtin, types
 
 from cudf.core.udf import api
-from cudf.core.udf._ops import (
-    arith_ops,
-    bitwise_ops,
-    comparison_ops,
-    unary_ops,
-)
+from cudf.core.udf._ops import binary_ops, unary_ops
 from cudf.core.udf.typing import MaskedType, NAType
 
 
@@ -230,7 +225,7 @@ def register_const_op(op):
 
 
 # register all lowering at init
-for binary_op in arith_ops + bitwise_ops + comparison_ops:
+for binary_op in binary_ops:
     register_arithmetic_op(binary_op)
     register_const_op(binary_op)
     # null op impl can be shared between all ops
@@ -1,6 +1,8 @@
 # Copyright (c) 2020-2022, NVIDIA CORPORATION.
 
 import operator
+import weakref
+from functools import lru_cache
 
 from numba import types
 from numba.core.extending import (
@@ -20,12 +22,7 @@ from numba.cuda.cudadecl import registry as cuda_decl_registry
 
 from cudf.core.missing import NA
 from cudf.core.udf import api
-from cudf.core.udf._ops import (
-    arith_ops,
-    bitwise_ops,
-    comparison_ops,
-    unary_ops,
-)
+from cudf.core.udf._ops import binary_ops, unary_ops
 
 SUPPORTED_NUMBA_TYPES = (
     types.Number,
@@ -33,6 +30,17 @@ SUPPORTED_NUMBA_TYPES = (
     types.NPDatetime,
     types.NPTimedelta,
 )
+# The concrete classes of the overwhelmingly common scalar types, which can be
+# checked with a single set lookup before walking SUPPORTED_NUMBA_TYPES.
+_SUPPORTED_NUMBA_CLASSES = frozenset(
+    (
+        types.Integer,
+        types.Float,
+        types.Boolean,
+        types.NPDatetime,
+        types.NPTimedelta,
+    )
+)
 
 
 class MaskedType(types.Type):
@@ -41,10 +49,33 @@ class MaskedType(types.Type):
     and a validity boolean, over which we can define math ops
     """
 
+    # Instances are interned by the value type they are constructed with so
+    # that the typing templates, which build a new `MaskedType` for nearly
+    # every operation they resolve, get back an already initialized type.
+    _cache: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __new__(cls, value):
+        try:
+            return cls._cache[value]
+        except KeyError:
+            self = super().__new__(cls)
+            cls._cache[value] = self
+            return self
+        except TypeError:
+            # Unhashable, hence unsupported, value. Leave it uncached so that
+            # `__init__` still turns it into a Poison value type.
+            return super().__new__(cls)
+
     def __init__(self, value):
+        if getattr(self, "_initialized", False):
+            # interned instance handed back by `__new__`
+            return
+        self._initialized = True
         # MaskedType in Numba shall be parameterized
         # with a value type
-        if isinstance(value, SUPPORTED_NUMBA_TYPES):
+        if type(value) in _SUPPORTED_NUMBA_CLASSES or isinstance(
+            value, SUPPORTED_NUMBA_TYPES
+        ):
             self.value_type = value
         else:
             # Unsupported Dtype. Numba tends to print out the type info
@@ -57,13 +88,26 @@ class MaskedType(types.Type):
                 f"Supported dtypes are {SUPPORTED_NUMBA_TYPES}"
             )
         super().__init__(name=f"Masked{self.value_type}")
+        self._hash = hash(("Masked", self.value_type))
 
     def __hash__(self):
         """
         Needed so that numba caches type instances with different
         `value_type` separately.
         """
-        return hash(repr(self))
+        try:
+            return self._hash
+        except AttributeError:
+            # Unpickled instance, see `__getstate__`
+            self._hash = hash(("Masked", self.value_type))
+            return self._hash
+
+    def __getstate__(self):
+        # The hash of the value type is derived from its name, which is not
+        # stable across processes, so it must not travel with a pickle.
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
 
     def unify(self, context, other):
         """
@@ -97,6 +141,9 @@ class MaskedType(types.Type):
         # two MaskedType unify to a new MaskedType whose value_type
         # is the result of unifying `self` and `other` `value_type`
         elif isinstance(other, MaskedType):
+            if self.value_type == other.value_type:
+                # e.g. both branches of an if/else yield the same type
+                return self
             return MaskedType(
                 context.unify_pairs(self.value_type, other.value_type)
             )
@@ -104,6 +151,8 @@ class MaskedType(types.Type):
         # if we have MaskedType and something that results in a
         # scalar, unify between the MaskedType's value_type
         # and that other thing
+        if other == self.value_type:
+            return self
         unified = context.unify_pairs(self.value_type, other)
         if unified is None:
             # The value types don't unify, so there is no unified masked type
@@ -122,11 +171,16 @@ class MaskedType(types.Type):
         return self.value_type == other.value_type
 
 
+@lru_cache(maxsize=None)
+def _masked_type_for(value_type):
+    return MaskedType(value_type)
+
+
 # For typing a Masked constant value defined outside a kernel (e.g. captured in
 # a closure).
 @typeof_impl.register(api.Masked)
 def typeof_masked(val, c):
-    return MaskedType(typeof(val.value))
+    return _masked_type_for(typeof(val.value))
 
 
 # Implemented typing for Masked(value, valid) - the construction of a Masked
@@ -147,6 +201,17 @@ class MaskedConstructor(ConcreteTemplate):
             | {types.boolean}
         )
     ]
+    # Exact (value, valid) argument types -> signature, so that the common
+    # case of constructing a Masked from one of the types above does not
+    # need to scan and rank every case.
+    _cases_by_args = {sig.args: sig for sig in cases}
+
+    def apply(self, args, kws):
+        if not kws:
+            sig = self._cases_by_args.get(tuple(args))
+            if sig is not None:
+                return sig
+        return super().apply(args, kws)
 
 
 # Provide access to `m.value` and `m.valid` in a kernel for a Masked `m`.
@@ -221,6 +286,7 @@ def typeof_na(val, c):
     Effectively make it so numba sees `cudf.NA` as an
     instance of this NAType -> handle it accordingly.
     """
+    # Always the module level singleton, no type is constructed per call
     return na_type
 
 
@@ -236,25 +302,6 @@ register_model(NAType)(models.OpaqueModel)
 # The following code accomplishes (1) - it is really just a way of specifying
 # that the <op> has a CUDA overload that accepts two `Masked` that
 # are parameterized with `value_type` and what flavor of `Masked` to return.
-class MaskedScalarArithOp(AbstractTemplate):
-    def generic(self, args, kws):
-        """
-        Typing for `Masked` <op> `Masked`
-        Numba expects a valid numba type to be returned if typing is successful
-        else `None` signifies the error state (this pattern is commonly used
-        in Numba)
-        """
-        if isinstance(args[0], MaskedType) and isinstance(args[1], MaskedType):
-            # In the case of op(Masked, Masked), the return type is a Masked
-            # such that Masked.value is the primitive type that would have
-            # been resolved if we were just operating on the
-            # `value_type`s.
-            return_type = self.context.resolve_function_type(
-                self.key, (args[0].value_type, args[1].value_type), kws
-            ).return_type
-            return nb_signature(MaskedType(return_type), args[0], args[1])
-
-
 class MaskedScalarUnaryOp(AbstractTemplate):
     def generic(self, args, kws):
         if len(args) == 1 and isinstance(args[0], MaskedType):
@@ -264,26 +311,43 @@ class MaskedScalarUnaryOp(AbstractTemplate):
             return nb_signature(MaskedType(return_type), args[0])
 
 
-class MaskedScalarNullOp(AbstractTemplate):
-    def generic(self, args, kws):
+class MaskedScalarBinaryOp(AbstractTemplate):
+    """
+    Typing for every binary op involving a `Masked`. A single template is
+    registered per op so that numba only calls one `generic` per resolution
+    attempt, which dispatches on the exact operand types to the relevant
+    handler below. Each handler follows the numba convention of returning
+    a signature if typing is successful, else `None` to signify the error
+    state.
+    """
+
+    def _masked_masked(self, args, kws):
+        """
+        Typing for `Masked` <op> `Masked`
+        """
+        # In the case of op(Masked, Masked), the return type is a Masked
+        # such that Masked.value is the primitive type that would have
+        # been resolved if we were just operating on the
+        # `value_type`s.
+        return_type = self.context.resolve_function_type(
+            self.key, (args[0].value_type, args[1].value_type), kws
+        ).return_type
+        return nb_signature(MaskedType(return_type), args[0], args[1])
+
+    def _masked_null(self, args, kws):
         """
         Typing for `Masked` + `NA`
         Handles situations like `x + cudf.NA`
         """
-        if isinstance(args[0], MaskedType) and isinstance(args[1], NAType):
-            # In the case of op(Masked, NA), the result has the same
-            # dtype as the original regardless of what it is
-            return nb_signature(
-                args[0],
-                args[0],
-                na_type,
-            )
-        elif isinstance(args[0], NAType) and isinstance(args[1], MaskedType):
-            return nb_signature(args[1], na_type, args[1])
-
-
-class MaskedScalarScalarOp(AbstractTemplate):
-    def generic(self, args, kws):
+        # Only dispatched to for exactly one `Masked` and one `NA`. In the
+        # case of op(Masked, NA), the result has the same dtype as the
+        # original regardless of what it is
+        lhs, rhs = args
+        if isinstance(lhs, MaskedType):
+            return nb_signature(lhs, lhs, na_type)
+        return nb_signature(rhs, na_type, rhs)
+
+    def _masked_scalar(self, args, kws):
         """
         Typing for `Masked` <op> a scalar (and vice-versa).
         handles situations like `x + 1`
@@ -291,12 +355,14 @@ class MaskedScalarScalarOp(AbstractTemplate):
         # In the case of op(Masked, scalar), we resolve the type between
         # the Masked value_type and the scalar's type directly
         to_resolve_types = None
-        if isinstance(args[0], MaskedType) and isinstance(
-            args[1], SUPPORTED_NUMBA_TYPES
+        if isinstance(args[0], MaskedType) and (
+            type(args[1]) in _SUPPORTED_NUMBA_CLASSES
+            or isinstance(args[1], SUPPORTED_NUMBA_TYPES)
         ):
             to_resolve_types = (args[0].value_type, args[1])
-        elif isinstance(args[0], SUPPORTED_NUMBA_TYPES) and isinstance(
-            args[1], MaskedType
+        elif isinstance(args[1], MaskedType) and (
+            type(args[0]) in _SUPPORTED_NUMBA_CLASSES
+            or isinstance(args[0], SUPPORTED_NUMBA_TYPES)
         ):
             to_resolve_types = (args[1].value_type, args[0])
         else:
@@ -311,6 +377,26 @@ class MaskedScalarScalarOp(AbstractTemplate):
             args[1],
         )
 
+    # Scalar operands may be any subclass of SUPPORTED_NUMBA_TYPES (literals
+    # included), so anything not listed here is handled by `_masked_scalar`.
+    _handlers = {
+        (MaskedType, MaskedType): _masked_masked,
+        (MaskedType, NAType): _masked_null,
+        (NAType, MaskedType): _masked_null,
+    }
+
+    def generic(self, args, kws):
+        # This template is consulted for every binary op typed on the
+        # device, most of which do not involve a `Masked` at all
+        if not (
+            isinstance(args[0], MaskedType) or isinstance(args[1], MaskedType)
+        ):
+            return None
+        handler = self._handlers.get((type(args[0]), type(args[1])))
+        if handler is None:
+            return self._masked_scalar(args, kws)
+        return handler(self, args, kws)
+
 
 @cuda_decl_registry.register_global(operator.is_)
 class MaskedScalarIsNull(AbstractTemplate):
@@ -356,11 +442,9 @@ class UnpackReturnToMasked(AbstractTemplate):
             return nb_signature(return_type, args[0])
 
 
-for binary_op in arith_ops + bitwise_ops + comparison_ops:
+for binary_op in binary_ops:
     # Every op shares the same typing class
-    cuda_decl_registry.register_global(binary_op)(MaskedScalarArithOp)
-    cuda_decl_registry.register_global(binary_op)(MaskedScalarNullOp)
-    cuda_decl_registry.register_global(binary_op)(MaskedScalarScalarOp)
+    cuda_decl_registry.register_global(binary_op)(MaskedScalarBinaryOp)
 
 for unary_op in unary_ops:
     cuda_decl_registry.register_global(unary_op)(MaskedScalarUnaryOp)
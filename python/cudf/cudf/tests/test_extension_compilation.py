@@ -1,5 +1,6 @@
 # Copyright (c) 2021-2022, NVIDIA CORPORATION.
 import operator
+import pickle
 
 import cupy as cp
 import numpy as np
@@ -69,6 +70,41 @@ def test_compile_masked_unary(op, ty):
     ptx, resty = compile_ptx(func, (MaskedType(ty),), cc=cc, device=True)
 
 
+@pytest.mark.parametrize("ty", number_types, ids=number_ids)
+def test_masked_type_interned(ty, monkeypatch):
+    masked_ty = MaskedType(ty)
+    assert MaskedType._cache[ty] is masked_ty
+
+    # Constructing an interned type again must not rerun its initialization
+    init_calls = []
+    original_init = types.Type.__init__
+
+    def counting_init(self, *args, **kwargs):
+        init_calls.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(types.Type, "__init__", counting_init)
+    assert MaskedType(ty) is masked_ty
+    assert not init_calls
+    assert masked_ty.value_type == ty
+
+
+def test_masked_type_unhashable_value():
+    masked_ty = MaskedType([1])
+    assert isinstance(masked_ty.value_type, types.Poison)
+
+
+@pytest.mark.parametrize("ty", number_types, ids=number_ids)
+def test_masked_type_pickle(ty):
+    masked_ty = MaskedType(ty)
+    # The cached hash is process specific and must not be pickled
+    assert "_hash" not in masked_ty.__getstate__()
+
+    unpickled = pickle.loads(pickle.dumps(masked_ty))
+    assert unpickled == masked_ty
+    assert hash(unpickled) == hash(masked_ty)
+
+
 @pytest.mark.parametrize("op", arith_ops)
 @pytest.mark.parametrize("ty", number_types, ids=number_ids)
 def test_execute_masked_binary(op, ty):